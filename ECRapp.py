@@ -1,14 +1,6 @@
 
-import pandas as pd
-import numpy as np
-import matplotlib.pyplot as plt
-import plotly.express as px
 import streamlit as st
-import geopandas as gpd
-import os, ast
-from dotenv import load_dotenv
-from plotter import Plotter
-from preprocessor import run_preprocessor
+from snapshot import compute_metrics, format_last_updated, is_default_view, load_landing_snapshot, save_landing_snapshot
 
 
 # ++++++++++++++++++++++++++++++++++++++++++ Configure page and Properties +++++++++++++++++++++++++++++++++++++++++
@@ -26,17 +18,82 @@ st.set_page_config(
 
 
 
+def make_title(last_updated):
+    st.title(f":bulb: Live NGED Embedded Capacity Register Dashboard: 2023 - 2038 \n\tLast Updated: {last_updated}")
+
+
+def format_MW_GW(capacity: float, feature):
+    """
+    Format and display capacity in KW or MW using based on capacity's value.
+
+    Converts the input value to MW if it's 1000 or greater,
+    otherwise displays it in KW. Uses Streamlit to render
+    the formatted capacity with HTML styling.
+
+    Args:
+        value (float): Capacity value in KW
+        feature (string): Name of capacity feature to convert
+    """
+    cap_value = capacity / 1000
+    if cap_value < 1:  # Display in MW
+        st.markdown(f"<b>{feature}</b><h3>{capacity:.2f}MW</h3>", unsafe_allow_html=True,)
+    else:  # Display in MW
+        st.markdown(f"<b>{feature}</b><h3>{cap_value:.4f}GW</h3>", unsafe_allow_html=True)
+
+
+def show_metrics(metrics: dict):
+    """Renders the metric tiles from the values returned by `compute_metrics`."""
+    capacity_containers = st.columns(len(metrics))
+    for container, (feature, value) in zip(capacity_containers, metrics.items()):
+        with container:
+            if feature == "MPANs Count":
+                st.markdown(f"<b>{feature}<h3>{value}</b></h3>", unsafe_allow_html=True)
+            else:
+                format_MW_GW(value, feature)
+
+
+# ++++++++++++++++++++++++++++++++++++++++++ Landing Snapshot +++++++++++++++++++++++++++++++++++++++++
+@st.cache_resource
+def data_cache_state():
+    """Process-wide flag recording whether `load_data` has returned at least once."""
+    return {"warm": False}
+
+# Paint the precomputed default view only while the data cache is cold
+cache_state = data_cache_state()
+landing = st.empty()
+snapshot = None if cache_state["warm"] else load_landing_snapshot()
+if snapshot:
+    with landing.container():
+        make_title(snapshot["last_updated"])
+        "---"
+        show_metrics(snapshot["metrics"])
+        "---"
+        st.plotly_chart(snapshot["figures"]["map"])
+        "---"
+        st.plotly_chart(snapshot["figures"]["sunburst"], use_container_width=True)
+
+
 # ++++++++++++++++++++++++++++++++++++++++++ Cache and Load Data +++++++++++++++++++++++++++++++++++++++++
 
 @st.cache_data
 def load_data(filename='processed_ecr'):
+    import geopandas as gpd
+    from preprocessor import run_preprocessor
+
     run_preprocessor()
     return gpd.read_file(f'./datastore/{filename}.geojson')
 
 raw_data = load_data('processed_ecr')
+cache_state["warm"] = True
+if snapshot:
+    landing.empty()
+
+# Plotter (and plotly.express) is only needed for the live view
+from plotter import Plotter
 
 # set page title
-st.title(f":bulb: Live NGED Embedded Capacity Register Dashboard: 2023 - 2038 \n\tLast Updated: {raw_data['Last Updated'].max().strftime('%A, %d/%m/%Y')}")
+last_updated = format_last_updated(raw_data)
+make_title(last_updated)
 
 def make_subheader(subheader):
     st.markdown(
@@ -49,6 +106,62 @@ def make_subheader(subheader):
 )
 
 
+# ++++++++++++++++++++++++++++++++++++++++++ MPAN/Substation Search +++++++++++++++++++++++++++++++++++++++++
+
+@st.cache_resource
+def load_lookup(_data, last_updated, n_rows):
+    """Builds the lookup index for `raw_data`, rebuilt whenever the loaded data changes."""
+    from lookup import LookupIndex
+
+    return LookupIndex(_data)
+
+lookup_index = load_lookup(raw_data, str(raw_data['Last Updated'].max()), len(raw_data))
+
+
+@st.fragment
+def show_search():
+    """Renders the search box; as a fragment it reruns without redrawing the rest of the dashboard."""
+    from lookup import NAME_FEATURES, normalise_key
+
+    query = st.text_input('Search', placeholder='Export MPAN/MSID, Town, County, Primary or Bulk Supply Point')
+    if not query:
+        return
+
+    positions, names, truncated = lookup_index.search(query)
+    if not positions:
+        st.info(f'No MPAN or name matches "{query}"')
+        return
+
+    if names:
+        matched = ', '.join(f'{NAME_FEATURES[feature]}: {name}' for feature, name in names)
+        st.caption(f'Matched {matched}' + (f' (showing first {len(names)} name matches)' if truncated else ''))
+
+    hits = raw_data.iloc[positions]
+    st.write(f'Found {hits.shape[0]} records')
+    st.dataframe(hits)
+
+    located = hits[hits.geometry.notna() & ~hits.geometry.is_empty]
+    if located.empty:
+        st.info('None of the matching records have a location to map')
+    else:
+        st.plotly_chart(Plotter(located.copy()).plotMap_of_MPANs(focus=True), key='search_map')
+
+    # Show the capacity of every Primary and Bulk Supply Point surrounding the hits
+    substations = {}
+    for primary, bsp in hits[['Primary', 'Bulk Supply Point']].drop_duplicates().itertuples(index=False):
+        for feature, rows in lookup_index.context(primary, bsp).items():
+            if rows:
+                name = normalise_key(primary if feature == 'Primary' else bsp)
+                substations.setdefault((feature, name), rows)
+
+    for (feature, name), rows in sorted(substations.items()):
+        make_subheader(f"{NAME_FEATURES[feature]}: {name}")
+        show_metrics(compute_metrics(raw_data.iloc[rows]))
+
+show_search()
+"---"
+
+
 # ++++++++++++++++++++++++++++++++++++++++++ Sidebar Filters +++++++++++++++++++++++++++++++++++++++++
 def create_sidebar(label, feature, placeholder):
     df = raw_data[~raw_data[feature].isna()]
@@ -92,60 +205,21 @@ plotter = Plotter(data)
 
 # ++++++++++++++++++++++++++++++++++++++++++ Metrics Container +++++++++++++++++++++++++++++++++++++++++
 "---"
-def format_MW_GW(capacity: float, feature):
-    """
-    Format and display capacity in KW or MW using based on capacity's value.
-
-    Converts the input value to MW if it's 1000 or greater,
-    otherwise displays it in KW. Uses Streamlit to render
-    the formatted capacity with HTML styling.
-
-    Args:
-        value (float): Capacity value in KW
-        feature (string): Name of capacity feature to convert
-    """
-    cap_value = capacity / 1000
-    if cap_value < 1:  # Display in MW
-        st.markdown(f"<b>{feature}</b><h3>{capacity:.2f}MW</h3>", unsafe_allow_html=True,)
-    else:  # Display in MW
-        st.markdown(f"<b>{feature}</b><h3>{cap_value:.4f}GW</h3>", unsafe_allow_html=True)
-
-
-capacity_containers = st.columns(7)
-
-with capacity_containers[0]:
-    total_mpans = data.shape[0]
-    st.markdown(f"<b>MPANs Count<h3>{total_mpans}</b></h3>", unsafe_allow_html=True)
-
-with capacity_containers[1]:
-    total_registered = data['Already connected Registered Capacity (MW)'].sum()
-    format_MW_GW(total_registered, 'Already Connected')
-
-with capacity_containers[2]:
-    format_MW_GW(data['Accepted to Connect Registered Capacity (MW)'].sum(), 'Accepted to Connect')
-
-with capacity_containers[3]:
-    format_MW_GW(data['Maximum Export Capacity (MW)'].sum(), 'Max Export Capacity')
-
-with capacity_containers[4]:
-    format_MW_GW(data['Maximum Import Capacity (MW)'].sum(), 'Max Import Capacity')
-
-with capacity_containers[5]:
-    format_MW_GW(data['Change to Maximum Export Capacity (MW)'].astype('float').sum(), 'Change to Maximum Export')
-
-with capacity_containers[6]:
-    format_MW_GW(data['Change to Maximum Import Capacity (MW)'].astype('float').sum(), 'Change to Maximum Import')
+metrics = compute_metrics(data)
+show_metrics(metrics)
 "---"
 
 
 # ++++++++++++++++++++++++++++++++++++++++++ Map Container +++++++++++++++++++++++++++++++++++++++++
-st.plotly_chart(plotter.plotMap_of_MPANs())
+map_fig = plotter.plotMap_of_MPANs()
+st.plotly_chart(map_fig)
 "---"
 st.markdown("\n")
 
 
 # ++++++++++++++++++++++++++++++++++++++++++ Sunburst Container +++++++++++++++++++++++++++++++++++++++++
-st.plotly_chart(plotter.plot_sunburst_LA_2_FSP(), use_container_width=True)
+sunburst_fig = plotter.plot_sunburst_LA_2_FSP()
+st.plotly_chart(sunburst_fig, use_container_width=True)
 st.markdown("\n\n")
 
 
@@ -181,4 +255,14 @@ st.plotly_chart(plotter.plotLineScatter_accpeted_over_time_by_source('', 'scatte
 #++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++ Empty Data +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
 
 st.write(f'Register showing {data.shape[0]} records')
-st.dataframe(data)
\ No newline at end of file
+st.dataframe(data)
+
+
+#++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++ Landing Snapshot +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+# Once per process, after the page has rendered, save the default view for the next cold start
+if not cache_state.get("snapshot_saved") and is_default_view(raw_data, data):
+    try:
+        save_landing_snapshot(last_updated, metrics, {"map": map_fig, "sunburst": sunburst_fig})
+        cache_state["snapshot_saved"] = True
+    except (OSError, ValueError, TypeError) as e:
+        print(f"could not save landing snapshot: {e}")
\ No newline at end of file
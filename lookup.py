@@ -0,0 +1,127 @@
+from bisect import bisect_left
+
+
+# features covered by the prefix index, with the label shown for matches
+NAME_FEATURES = {
+    "Town_City": "Town",
+    "County": "County",
+    "Primary": "Primary",
+    "Bulk Supply Point": "Bulk Supply Point",
+}
+
+
+def normalise_key(value) -> str | None:
+    """Normalises an MPAN or name to a lookup key, returning None for missing values."""
+    if value is None or value != value:  # NaN
+        return None
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    key = str(value).strip()
+    return key or None
+
+
+class LookupIndex:
+    """
+    An index for jumping straight to MPANs, towns, counties and substations.
+
+    Rows are stored as positions into the data the index was built from, so
+    hits must be sliced out of that same data with `iloc`.
+
+    Attributes:
+        mpans (dict): Hash index of 'Export MPAN_MSID' to row positions.
+        names (dict): Hash index of (feature, name) to row positions.
+        prefixes (list): Sorted (lowercase name, feature, name) entries for prefix search.
+    """
+
+    def __init__(self, data) -> None:
+        self.mpans = self._build_hash_index(data["Export MPAN_MSID"])
+
+        self.names = {}
+        for feature in NAME_FEATURES:
+            for name, positions in self._build_hash_index(data[feature]).items():
+                self.names[(feature, name)] = positions
+        self.prefixes = sorted((name.lower(), feature, name) for feature, name in self.names)
+
+    @staticmethod
+    def _build_hash_index(column) -> dict:
+        """Maps each normalised value in the column to the row positions holding it."""
+        index = {}
+        for position, value in enumerate(column):
+            key = normalise_key(value)
+            if key is not None:
+                index.setdefault(key, []).append(position)
+        return index
+
+    def lookup_mpan(self, mpan) -> list:
+        """Returns the row positions for an exact Export MPAN/MSID, in constant time."""
+        return self.mpans.get(normalise_key(mpan), [])
+
+    def search_names(self, prefix: str, limit: int = 20) -> list:
+        """
+        Finds town, county and substation names starting with the given prefix.
+
+        Args:
+            prefix (str): Case-insensitive start of the name.
+            limit (int): Maximum number of names to return.
+
+        Returns:
+            list: (feature, name) tuples in alphabetical order.
+        """
+        prefix = prefix.strip().lower()
+        if not prefix:
+            return []
+
+        matches = []
+        for i in range(bisect_left(self.prefixes, (prefix,)), len(self.prefixes)):
+            key, feature, name = self.prefixes[i]
+            if not key.startswith(prefix) or len(matches) == limit:
+                break
+            matches.append((feature, name))
+        return matches
+
+    def rows_for_name(self, feature: str, name: str) -> list:
+        """Returns the row positions holding the given name in the given feature."""
+        return self.names.get((feature, name), [])
+
+    def search(self, query: str, limit: int = 20) -> tuple:
+        """
+        Resolves a search box query to row positions.
+
+        An exact MPAN match wins; otherwise rows of every name matching the
+        query as a prefix are returned.
+
+        Args:
+            query (str): An Export MPAN/MSID or the start of a name.
+            limit (int): Maximum number of names to match.
+
+        Returns:
+            tuple: (row positions, matched (feature, name) tuples, whether more names matched than `limit`)
+        """
+        positions = self.lookup_mpan(query)
+        if positions:
+            return positions, [], False
+
+        names = self.search_names(query, limit + 1)
+        truncated = len(names) > limit
+        names = names[:limit]
+
+        rows = set()
+        for feature, name in names:
+            rows.update(self.rows_for_name(feature, name))
+        return sorted(rows), names, truncated
+
+    def context(self, primary, bsp) -> dict:
+        """
+        Returns the surrounding capacity context of a record.
+
+        Args:
+            primary: The record's 'Primary' substation.
+            bsp: The record's 'Bulk Supply Point'.
+
+        Returns:
+            dict: Row positions sharing the same Primary and the same Bulk Supply Point.
+        """
+        return {
+            "Primary": self.rows_for_name("Primary", normalise_key(primary)),
+            "Bulk Supply Point": self.rows_for_name("Bulk Supply Point", normalise_key(bsp)),
+        }
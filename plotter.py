@@ -1,9 +1,23 @@
 
-import geopandas as gpd
+from __future__ import annotations
 import plotly.express as px
 import pandas as pd
-from dotenv import load_dotenv, find_dotenv
-import os, ast
+import os, ast, math
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import geopandas as gpd
+
+
+@lru_cache(maxsize=None)
+def get_palette(name: str) -> list:
+    """Reads a colour palette from .env, parsing the config only once per process."""
+    from dotenv import load_dotenv, find_dotenv
+
+    load_dotenv(find_dotenv('.env'))
+    return ast.literal_eval(os.getenv(name))
+
 
 class Plotter:
     """
@@ -210,9 +224,7 @@ class Plotter:
     
     def plot_sunburst_LA_2_FSP(self):
         # Reshape the data for sunburst chart
-        load_dotenv(find_dotenv('.env'))
-
-        blue_purple = ast.literal_eval(os.getenv('blue_purple'))
+        blue_purple = get_palette('blue_purple')
 
         cols = ['Maximum Export Capacity (MW)', 'Maximum Import Capacity (MW)', 'Change to Maximum Export Capacity (MW)', 'Change to Maximum Import Capacity (MW)']
         self.gdf[cols] = self.gdf[cols].apply(pd.to_numeric, errors='coerce')
@@ -246,7 +258,28 @@ class Plotter:
 
     
 
-    def plotMap_of_MPANs(self):
+    def _focus_view(self, width: int = 800, height: int = 500):
+        """
+        Derives a map centre and zoom that fit every point of the (EPSG:4326) GeoDataFrame.
+
+        Args:
+            width (int): Approximate map width in pixels.
+            height (int): Map height in pixels.
+
+        Returns:
+            tuple: (center dict with 'lat' and 'lon', zoom level)
+        """
+        min_lon, min_lat, max_lon, max_lat = self.gdf.total_bounds
+        center = {'lat': (min_lat + max_lat) / 2, 'lon': (min_lon + max_lon) / 2}
+
+        # Web Mercator: the world is 256 * 2**zoom pixels wide; latitude spans stretch by 1/cos(lat)
+        lon_span = max(max_lon - min_lon, 1e-6)
+        lat_span = max(max_lat - min_lat, 1e-6) / math.cos(math.radians(center['lat']))
+        zoom = math.log2(min(360 * width / (256 * lon_span), 360 * height / (256 * lat_span))) - 0.5
+        return center, min(max(zoom, 3), 14)
+
+
+    def plotMap_of_MPANs(self, focus: bool = False):
         """
         Creates an interactive map layer visualization of the GeoDataFrame.
 
@@ -255,6 +288,10 @@ class Plotter:
         geographical distribution of energy connection data, with layers colored
         by Licence Area. The visualization uses a dark-themed tile layer.
 
+        Args:
+            focus (bool): Centre and zoom the map on the bounds of the MPANs
+                instead of the default regional view. Rows must have a geometry.
+
         Returns:
             folium.Map: An interactive map object displaying the selected features
             from the GeoDataFrame, with color coding based on Licence Area.
@@ -265,7 +302,7 @@ class Plotter:
         self.gdf['Accepted to Connect Registered Capacity (MW)'].fillna(0, inplace=True)
         self.gdf['Already connected Registered Capacity (MW)'].fillna(0, inplace=True)
 
-        
+        center, zoom = self._focus_view() if focus else (None, 6)
         fig = px.scatter_mapbox(data_frame=self.gdf,
                                 lat=self.gdf.geometry.y,
                                 lon=self.gdf.geometry.x,
@@ -280,7 +317,8 @@ class Plotter:
                                 color_discrete_sequence=['#0000FF', '#FFF700', '#80ff80', '#FF0000'],  
                                 size='Accepted to Connect Registered Capacity (MW)',  
                                 size_max=100, 
-                                zoom=6,
+                                center=center,
+                                zoom=zoom,
                                 mapbox_style="carto-darkmatter", 
                                 title="MPAN Locations by Licence Area"
         )
@@ -1,6 +1,4 @@
 # Import packages
-from pdb import run
-import requests
 import numpy as np
 import pandas as pd
 import geopandas as gpd
@@ -21,6 +19,7 @@ class DataDownloader:
     def download_data(self) -> None:
         """Downloads data from the specified URL and saves it to the file path."""
         print("downloading data ...")
+        import requests
 
         # get response from url
         response = requests.get(self.url)
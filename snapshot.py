@@ -0,0 +1,89 @@
+import json
+import os
+import tempfile
+
+
+SNAPSHOT_PATH = "./datastore/landing_snapshot.json"
+
+# sidebar slicer features; their defaults select every non-missing value
+SLICER_FEATURES = ["Licence Area", "PoC Voltage (KV)", "Connection Status"]
+
+# (tile label, capacity feature) pairs shown in the metrics container
+METRIC_FEATURES = [
+    ("Already Connected", "Already connected Registered Capacity (MW)"),
+    ("Accepted to Connect", "Accepted to Connect Registered Capacity (MW)"),
+    ("Max Export Capacity", "Maximum Export Capacity (MW)"),
+    ("Max Import Capacity", "Maximum Import Capacity (MW)"),
+    ("Change to Maximum Export", "Change to Maximum Export Capacity (MW)"),
+    ("Change to Maximum Import", "Change to Maximum Import Capacity (MW)"),
+]
+
+
+def compute_metrics(data) -> dict:
+    """
+    Computes the values shown in the metrics container.
+
+    Args:
+        data (pd.DataFrame): The (filtered) register data.
+
+    Returns:
+        dict: MPAN count and the summed capacity of each metric feature, keyed by tile label.
+    """
+    metrics = {"MPANs Count": int(data.shape[0])}
+    for label, feature in METRIC_FEATURES:
+        metrics[label] = float(data[feature].astype("float").sum())
+    return metrics
+
+
+def format_last_updated(data) -> str:
+    """Formats the most recent 'Last Updated' date for the page title."""
+    import pandas as pd
+
+    return pd.to_datetime(data["Last Updated"]).max().strftime("%A, %d/%m/%Y")
+
+
+def is_default_view(raw_data, data) -> bool:
+    """Checks whether the filtered data is the default "all filters selected" view."""
+    return len(data) == int(raw_data[SLICER_FEATURES].notna().all(axis=1).sum())
+
+
+def save_landing_snapshot(last_updated: str, metrics: dict, figures: dict, output_path: str = SNAPSHOT_PATH) -> None:
+    """
+    Saves the default "all filters selected" view to JSON for the next cold start.
+
+    Args:
+        last_updated (str): The formatted 'Last Updated' title date.
+        metrics (dict): The metric tile values from `compute_metrics`.
+        figures (dict): Plotly figures of the default view, keyed by 'map' and 'sunburst'.
+        output_path (str): Where to write the snapshot.
+    """
+    snapshot = {
+        "last_updated": last_updated,
+        "metrics": metrics,
+        "figures": {name: json.loads(fig.to_json()) for name, fig in figures.items()},
+    }
+
+    # write to a temp file and swap it in, so readers never see a partial snapshot
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(output_path), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(snapshot, f)
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+
+def load_landing_snapshot(path: str = SNAPSHOT_PATH) -> dict | None:
+    """Loads the landing snapshot, or returns None if it is missing or unreadable."""
+    try:
+        with open(path) as f:
+            snapshot = json.load(f)
+        # make sure everything the landing view reads is present
+        if not all(key in snapshot for key in ("last_updated", "metrics", "figures")):
+            return None
+        if not all(name in snapshot["figures"] for name in ("map", "sunburst")):
+            return None
+        return snapshot
+    except (OSError, ValueError, KeyError, TypeError):
+        return None